@@ -7,9 +7,9 @@ pipeline functions used in the main Python scripts (HTML removal, emoji
 removal, stopword removal, contractions expansion, etc.).
 
 Key Features:
-- Upload a CSV file containing a 'Comment' column
-- Clean all comments instantly using the clean_comment() function
-- View before/after results with word statistics
+- Upload a CSV or Parquet file containing a 'Comment' column
+- Clean all comments instantly using the vectorized clean_series() pipeline
+- View before/after results with word statistics, page by page
 - Download the full cleaned dataset as CSV
 - Modern UI styling using custom CSS
 """
@@ -23,11 +23,14 @@ from pathlib import Path
 # Add src directory to Python path so cleaning_functions can be imported
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-# Import the cleaning function
-from cleaning_functions import clean_comment
+# Import the vectorized cleaning pipeline (multi-core for large files)
+from cleaning_functions import clean_series_parallel
 
 st.set_page_config(page_title="Data Cleaning Pipeline", layout="wide")
 
+# Rows shown per page in the before/after table (the download has all rows)
+PAGE_SIZE = 200
+
 # Custom CSS for styling
 st.markdown("""
 <style>
@@ -80,45 +83,71 @@ st.markdown("Upload CSV, clean all comments, preview everything, download result
 # Sidebar Information
 st.sidebar.header("About")
 st.sidebar.info(
-    "Upload a CSV file with customer feedback. The app will clean ALL records "
+    "Upload a CSV or Parquet file with customer feedback. The app will clean ALL records "
     "(remove emojis, HTML, contractions, special chars, stopwords), show full before/after comparison, "
     "and let you download the complete cleaned dataset."
 )
 
 st.sidebar.header("Features")
 st.sidebar.markdown("""
-- Upload CSV (with 'Comment' column)
+- Upload CSV or Parquet (with 'Comment' column)
 - Clean ALL comments instantly
 - View before/after for every record
 - Download full cleaned dataset
 - Performance metrics & statistics
 """)
 
+# Cached Processing: read + clean an uploaded file
+@st.cache_data(show_spinner="Processing all comments...")
+def process_upload(file_bytes, file_name):
+    """
+    Read an uploaded CSV/Parquet file and clean its 'Comment' column.
+
+    Cached on the file contents, so reruns triggered by paging or the
+    download button reuse the cleaned frame instead of cleaning again.
+    Returns None if the file has no 'Comment' column.
+    """
+    buf = io.BytesIO(file_bytes)
+
+    # Parquet is columnar and already typed, so it skips CSV text parsing
+    if file_name.endswith('.parquet'):
+        df = pd.read_parquet(buf)
+    else:
+        # Arrow's multithreaded parser, keeping columns Arrow-backed
+        df = pd.read_csv(buf, engine='pyarrow', dtype_backend='pyarrow')
+
+        # Text that is not valid UTF-8 comes back as raw bytes; drop
+        # the bad bytes the way encoding_errors="ignore" used to
+        if 'Comment' in df.columns and df['Comment'].dtype == 'binary[pyarrow]':
+            df['Comment'] = df['Comment'].astype(object).str.decode('utf-8', errors='ignore')
+
+    # Check if the required column exists
+    if 'Comment' not in df.columns:
+        return None
+
+    # Clean all comments (empty cells count as empty comments)
+    comments = df['Comment'].astype('string').fillna('')
+    df['Cleaned_Comment'] = clean_series_parallel(comments)
+
+    # Word counts straight from the columns (no per-row apply)
+    df['Words_Before'] = comments.str.split().str.len()
+    df['Words_After'] = df['Cleaned_Comment'].str.split().str.len()
+    df['Words_Removed'] = df['Words_Before'] - df['Words_After']
+    return df
+
 # File Upload Section
-uploaded_file = st.file_uploader("Upload your CSV file *", type="csv")
+uploaded_file = st.file_uploader("Upload your CSV or Parquet file *", type=["csv", "parquet"])
 
 # Main Processing Logic
 if uploaded_file:
     try:
-        df = pd.read_csv(uploaded_file, encoding="utf-8", encoding_errors="ignore")
+        df = process_upload(uploaded_file.getvalue(), uploaded_file.name)
 
-        
-        # Check if the required column exists
-        if 'Comment' not in df.columns:
+        if df is None:
             st.error("❌ Your file must have a column named 'Comment'.")
         else:
             st.success(f"✅ File uploaded! {len(df)} comments found.")
             
-            # Clean all comments with loading spinner
-            with st.spinner("Processing all comments..."):
-                results = df['Comment'].apply(lambda x: clean_comment(x))
-
-                # Extract cleaned data and word counts
-                df['Cleaned_Comment'] = results.apply(lambda x: x[0])
-                df['Words_Before'] = results.apply(lambda x: x[1])
-                df['Words_After'] = results.apply(lambda x: x[2])
-                df['Words_Removed'] = df['Words_Before'] - df['Words_After']
-            
             # Display Metrics Section
             col1, col2, col3, col4 = st.columns(4)
             with col1:
@@ -133,20 +162,27 @@ if uploaded_file:
             # Display Before/After Table
             st.subheader(f"All {len(df)} Comments - Before & After")
             
+            # Pick the page to show; only that slice is copied and sent to the browser
+            page_start = 0
+            if len(df) > PAGE_SIZE:
+                page_start = st.slider("Show rows starting at", 0, len(df) - 1, 0, step=PAGE_SIZE)
+            page_end = min(page_start + PAGE_SIZE, len(df))
+            st.caption(f"Showing rows {page_start + 1}-{page_end} of {len(df)}")
+
             # Prepare table for display
-            display_df = df[['Comment', 'Cleaned_Comment', 'Words_Before', 'Words_After', 'Words_Removed']].copy()
-            display_df.columns = ['Original Comment', 'Cleaned Comment', 'Before', 'After', 'Removed']
+            display_df = df.iloc[page_start:page_end][['Comment', 'Cleaned_Comment', 'Words_Before', 'Words_After', 'Words_Removed']]
+            display_df = display_df.set_axis(['Original Comment', 'Cleaned Comment', 'Before', 'After', 'Removed'], axis=1)
             
             # Use Streamlit's data editor for scrollable, interactive table
             st.dataframe(display_df, use_container_width=True, height=400)
             
             # Download Cleaned Results
             st.subheader("Download Full Results")
-            buf = io.StringIO()
-            df.to_csv(buf, index=False)
+            # Encode straight to bytes (no StringIO buffer plus str copy)
+            csv_bytes = df.to_csv(index=False).encode('utf-8')
             st.download_button(
                 label="📥 Download Cleaned Data (CSV)",
-                data=buf.getvalue(),
+                data=csv_bytes,
                 file_name="cleaned_comments_full.csv",
                 mime="text/csv"
             )
@@ -156,7 +192,7 @@ if uploaded_file:
 
 else:
     # Show sample format if file not yet uploaded
-    st.info("👆 Upload a CSV file to begin. Example format:")
+    st.info("👆 Upload a CSV or Parquet file to begin. Example format:")
     sample = pd.DataFrame({
         "Comment": [
             "I love this! 😍 <br> Amazing",
@@ -1,31 +1,39 @@
 import nltk
 import os
 
-# Ensure required NLTK resources are installed
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+# -------------------------------------------------------
+# ENSURE REQUIRED NLTK RESOURCES ARE INSTALLED (ONCE)
+# -------------------------------------------------------
+def _ensure_nltk():
+    """Download the NLTK stopwords corpus if it is missing."""
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords')
+
+    # Worker processes inherit the environment, so they skip the check
+    os.environ["PIPELINE_NLTK_BOOTSTRAPPED"] = "1"
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+if os.environ.get("PIPELINE_NLTK_BOOTSTRAPPED") != "1":
+    _ensure_nltk()
 
 import re
-import emoji
 import html
+import string
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import filterfalse
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-import contractions
+from contractions import contractions_dict, leftovers_dict, slang_dict
 
 # -------------------------------------------------------
 # LOAD STOPWORDS AND PROTECT IMPORTANT NEGATION WORDS
 # -------------------------------------------------------
-stop_words = set(stopwords.words("english"))
+stop_words = frozenset(stopwords.words("english"))
 
 # Negation words that MUST be preserved (never removed)
-negation_words = {
+negation_words = frozenset({
     "not", "no", "never", "none",
     "did", "did not",
     "was", "was not",
@@ -35,51 +43,132 @@ negation_words = {
     "should not", "shouldn't",
     "could not", "couldn't",
     "would not", "wouldn't"
-}
+})
 
-# Remove negation words from stopwords so they are preserved
+# Remove negation words from stopwords so they are preserved.
+# Both sets are frozen: read-only after import, so worker processes can
+# share them without copies.
 stop_words = stop_words - negation_words
 
+# -------------------------------------------------------
+# PRECOMPILED PATTERNS (SHARED WITH THE VECTORIZED PIPELINE)
+# -------------------------------------------------------
+HTML_RE = re.compile(r"<.*?>")
+EMOJI_RE = re.compile("[\U0001F000-\U0001FAFF\u2600-\u27BF\uFE0F\u200D]+")
+REPEAT_RE = re.compile(r"(.)\1{2,}")
+SYMBOL_RE = re.compile(r"[^a-zA-Z\s]")
+
+# Single-pass pattern for the steps that need a regex: HTML tags and runs
+# of 3+ repeated letters. Only letter runs are shortened here: repeated
+# symbols and whitespace are blanked/squashed anyway, so the result matches
+# the step-by-step functions. Emojis and symbols are left to _TRANS.
+MEGA_RE = re.compile(
+    rf"(?P<html>{HTML_RE.pattern})"
+    r"|(?P<rep>(?P<ch>[a-zA-Z])(?P=ch){2,})"
+)
+
+def _dispatch(match):
+    """Replacement for MEGA_RE: keep two letters of a run, blank tags."""
+    if match.lastgroup == "rep":
+        return match.group("ch") * 2
+    return " "
+
+class _LowercaseLettersTable(dict):
+    """str.translate table: A-Z -> a-z, a-z kept, anything else -> space."""
+    def __missing__(self, codepoint):
+        # Remember the answer so each emoji/symbol hits Python only once
+        self[codepoint] = " "
+        return " "
+
+# Lowercase + symbol/emoji removal in one C-level str.translate pass
+_TRANS = _LowercaseLettersTable({ord(c): c.lower() for c in string.ascii_letters})
+
 # -------------------------------------------------------
 # REMOVE HTML TAGS (BUT KEEP TEXT INSIDE TAGS)
 # -------------------------------------------------------
 def remove_html_tags(text):
     """Remove HTML tags but keep the text inside them."""
     text = html.unescape(text)
-    return re.sub(r"<.*?>", " ", text)
+    return HTML_RE.sub(" ", text)
 
 # -------------------------------------------------------
 # REMOVE EMOJIS
 # -------------------------------------------------------
 def remove_emojis(text):
     """Remove emojis from text safely."""
-    return emoji.replace_emoji(text, replace=" ")
+    return EMOJI_RE.sub(" ", text)
 
 # -------------------------------------------------------
 # EXPAND CONTRACTIONS SAFELY
 # -------------------------------------------------------
+# Same mapping contractions.fix() uses, keyed in lowercase. "can not" is
+# folded in so it becomes "cannot" in the same pass.
+_CD = {}
+for _mapping in (contractions_dict, leftovers_dict, slang_dict):
+    _CD.update((k.lower(), v) for k, v in _mapping.items())
+_CD["can not"] = "cannot"
+
+def _trie_pattern(words):
+    """
+    Build a regex alternation of words with shared prefixes factored out.
+
+    A flat "a|b|c|..." over ~600 keys is retried key by key at every word
+    start; the trie form lets the engine follow one branch per character.
+    Longer continuations are tried first, so "wouldn't've" wins over
+    "wouldn't".
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def walk(node):
+        branches = [re.escape(ch) + walk(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        pattern = "(?:" + "|".join(branches) + ")"
+        return pattern + "?" if "" in node else pattern
+
+    return walk(trie)
+
+_CONTR_RE = re.compile(
+    r"(?<![A-Za-z0-9_])(" + _trie_pattern(_CD) + r")(?![A-Za-z0-9_])",
+    re.IGNORECASE,
+)
+
+def _expand_contraction(match):
+    """Expand one matched contraction, following the casing of the match."""
+    found = match.group(0)
+    expanded = _CD[found.lower()]
+    if found == found.upper():
+        return expanded.upper()
+    if found == found.title():
+        return expanded.title()
+    if found == found.lower():
+        return expanded.lower()
+    if found == found[0].upper() + found[1:].lower():
+        return expanded[0].upper() + expanded[1:].lower()
+    return expanded
+
 def expand_contractions_text(text):
     """Expand contractions such as didn't → did not."""
-    expanded = contractions.fix(text)
-    
-    # contractions library does: "can not" → we correct it:
-    expanded = expanded.replace("can not", "cannot")
-    
-    return expanded
+    return _CONTR_RE.sub(_expand_contraction, text)
 
 # -------------------------------------------------------
 # NORMALIZE REPEATED CHARACTERS
 # -------------------------------------------------------
 def normalize_repeated_characters(text):
     """Normalize repeated characters: goooood → good."""
-    return re.sub(r"(.)\1{2,}", r"\1\1", text)
+    return REPEAT_RE.sub(r"\1\1", text)
 
 # -------------------------------------------------------
 # REMOVE SYMBOLS BUT KEEP WORDS
 # -------------------------------------------------------
 def remove_symbols(text):
     """Remove punctuation and symbols but keep readable text."""
-    return re.sub(r"[^a-zA-Z\s]", " ", text)
+    return SYMBOL_RE.sub(" ", text)
 
 # -------------------------------------------------------
 # LOWERCASE TEXT
@@ -92,16 +181,10 @@ def lowercase_text(text):
 # -------------------------------------------------------
 def remove_stopwords(text):
     """Remove standard stopwords but keep negation words."""
-    words = word_tokenize(text)
-    cleaned = []
-    
-    for w in words:
-        if w in negation_words:
-            cleaned.append(w)
-        elif w not in stop_words:
-            cleaned.append(w)
-    
-    return " ".join(cleaned)
+    # Text is already lowercase letters and spaces here, so a plain split
+    # tokenizes it; stop_words has the negation words taken out already.
+    # filterfalse + the set's own __contains__ keeps the loop in C.
+    return " ".join(filterfalse(stop_words.__contains__, text.split()))
 
 # -------------------------------------------------------
 # COUNT WORDS
@@ -112,6 +195,9 @@ def count_words(text):
 # -------------------------------------------------------
 # MASTER CLEANING PIPELINE
 # -------------------------------------------------------
+# Feedback repeats a lot ("works perfectly", "not satisfied"), so results
+# are memoized; the returned string is immutable and safe to share.
+@lru_cache(maxsize=100_000)
 def clean_comment(text):
     """
     Balanced cleaning pipeline:
@@ -122,23 +208,80 @@ def clean_comment(text):
      - Lowercase
      - Remove symbols
      - Remove stopwords (negation-safe)
-    """
-    words_before = count_words(text)
 
+    HTML tags and repeats are handled in a single MEGA_RE pass, then
+    lowercasing and emoji/symbol removal in a single str.translate pass.
+
+    Returns only the cleaned text; word counts do not depend on the
+    pipeline and are computed by the caller (see count_words()).
+    """
     cleaned = expand_contractions_text(text)
-    cleaned = remove_html_tags(cleaned)
-    cleaned = remove_emojis(cleaned)
-    cleaned = normalize_repeated_characters(cleaned)
-    cleaned = lowercase_text(cleaned)
-    cleaned = remove_symbols(cleaned)
+    cleaned = html.unescape(cleaned)
+    cleaned = MEGA_RE.sub(_dispatch, cleaned).translate(_TRANS)
+    # remove_stopwords() splits on whitespace and rejoins with single
+    # spaces, so its output needs no further whitespace cleanup
     cleaned = remove_stopwords(cleaned)
 
-    # remove extra spaces
-    cleaned = " ".join(cleaned.split())
+    return cleaned
+
+# -------------------------------------------------------
+# VECTORIZED CLEANING PIPELINE (WHOLE COLUMN AT ONCE)
+# -------------------------------------------------------
+def clean_series(comments):
+    """
+    Clean a whole pandas Series of comments with Series.str operations.
+
+    Produces the same text as clean_comment(), but each regex step runs
+    once over the column instead of calling clean_comment() per row.
+    Duplicate comments are cleaned only once and mapped back to every row.
+    Word counts are left to the caller (Series.str.split().str.len()).
+    """
+    unique = comments.drop_duplicates()
+
+    cleaned = unique.map(expand_contractions_text, na_action="ignore")
+    cleaned = cleaned.map(html.unescape, na_action="ignore")
+
+    cleaned = cleaned.str.replace(MEGA_RE, _dispatch, regex=True).str.translate(_TRANS)
+    # Stopword removal also leaves single-spaced, stripped text
+    cleaned = cleaned.map(remove_stopwords, na_action="ignore")
+
+    return comments.map(dict(zip(unique, cleaned)))
+
+# -------------------------------------------------------
+# PARALLEL CLEANING (MULTI-CORE, FOR LARGE COLUMNS)
+# -------------------------------------------------------
+# Below this many rows, starting worker processes costs more than it saves
+PARALLEL_MIN_ROWS = 50_000
+
+def clean_series_parallel(comments, max_workers=None, executor=None):
+    """
+    Run clean_series() on chunks of the column across a process pool.
+
+    Cleaning is CPU-bound pure Python, so processes (not threads) are used.
+    The column is split into about four chunks per worker to amortize the
+    pickling cost of each task. Small columns are cleaned in-process.
+    Duplicates are dropped before chunking, so no worker repeats another's
+    work.
+
+    Callers that clean a stream of batches can pass their own executor so
+    the worker processes are started once and reused for every batch;
+    otherwise a pool is created for this call only.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    unique = comments.drop_duplicates()
+    if max_workers == 1 or len(unique) < PARALLEL_MIN_ROWS:
+        return clean_series(comments)
+
+    chunksize = max(1, len(unique) // (max_workers * 4))
+    chunks = [unique.iloc[i:i + chunksize] for i in range(0, len(unique), chunksize)]
 
-    words_after = count_words(cleaned)
+    if executor is not None:
+        cleaned = pd.concat(executor.map(clean_series, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            cleaned = pd.concat(ex.map(clean_series, chunks))
 
-    return cleaned, words_before, words_after
+    return comments.map(dict(zip(unique, cleaned)))
 
 # -------------------------------------------------------
 # SUCCESS FLAG
@@ -152,6 +295,6 @@ def flag_cleaning_success(original_text, cleaned_text):
 if __name__ == "__main__":
     test_comment = "Didn't meet expectations weren't 😡😡 <div>Gooood quality though</div>"
     print("Original:", test_comment)
-    cleaned, b, a = clean_comment(test_comment)
+    cleaned = clean_comment(test_comment)
     print("Cleaned:", cleaned)
-    print("Words:", b, "->", a)
+    print("Words:", count_words(test_comment), "->", count_words(cleaned))
@@ -16,8 +16,13 @@ The generated dataset is saved into:
 This file is useful for testing and validating the cleaning pipeline.
 """
 
+import math
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import random
+from collections import Counter
+from itertools import product
 
 
 # Predefined lists containing various types of text fragments to simulate realistic customer comments.
@@ -84,68 +89,112 @@ additional_phrases = [
 ]
 
 # Dataset generation logic
+#
+# Each comment has a "shape" (sentiment + which optional parts it contains)
+# and a choice of item for each part. Shapes are drawn with the usual odds;
+# then, per shape, distinct item combinations are picked in one go with
+# random.sample over the shape's index space. Comments are unique by
+# construction, so there is no retry-on-duplicate loop; only rows that land
+# on an already-full shape get a new shape drawn.
+
+NUM_COMMENTS = 200
+
+# Base phrases and emoji set for each sentiment
+sentiment_pools = {
+    'positive': (positive_phrases, emojis_positive),
+    'negative': (negative_phrases, emojis_negative),
+    'neutral': (neutral_phrases, emojis_neutral),
+}
+
+def shape_pools(shape):
+    """Pools a comment of this shape picks from, in the order they appear."""
+    sentiment, has_contraction, has_phrase, num_emojis, has_html, has_special = shape
+    base_pool, emoji_set = sentiment_pools[sentiment]
+
+    pools = [base_pool]
+    if has_contraction:
+        pools.append(contractions)
+    if has_phrase:
+        pools.append(additional_phrases)
+    pools += [emoji_set] * num_emojis
+    if has_html:
+        pools.append(html_tags)
+    if has_special:
+        pools.append(special_chars)
+    return pools
+
+def shape_space(shape):
+    """Number of distinct comments a shape can produce."""
+    return math.prod(len(pool) for pool in shape_pools(shape))
+
+def draw_shape():
+    """Draw the shape of one comment (sentiment + which optional parts it has)."""
+    return (
+        random.choice(['positive', 'negative', 'neutral']),
+        random.random() > 0.5,  # contraction (50% chance)
+        random.random() > 0.4,  # additional phrase (60% chance)
+        random.randint(1, 3),   # number of emojis (1-3)
+        random.random() > 0.6,  # HTML tag (40% chance)
+        random.random() > 0.5,  # special characters (50% chance)
+    )
+
+# Fail early if there are not enough distinct comments to draw from
+all_shapes = product(sentiment_pools, (False, True), (False, True), (1, 2, 3), (False, True), (False, True))
+if NUM_COMMENTS > sum(shape_space(shape) for shape in all_shapes):
+    raise ValueError(f"Cannot generate {NUM_COMMENTS} unique comments from the available phrases")
+
+# Draw the shape of every comment and count how often each shape occurs.
+# A shape cannot hold more comments than its combinations; rows beyond
+# that are redrawn with a new shape until every row has a place.
+shape_counts = Counter()
+shortfall = NUM_COMMENTS
+while shortfall:
+    for _ in range(shortfall):
+        shape = draw_shape()
+        if shape_counts[shape] < shape_space(shape):
+            shape_counts[shape] += 1
+    shortfall = NUM_COMMENTS - sum(shape_counts.values())
 
 comments = [] # Final list of generated comments
-used_combinations = set() # Keeps track of unique comments to avoid duplicates
-
-# Continue until 200 unique comments are generated
-while len(comments) < 200:
-    
-    # Randomly choose a sentiment type
-    sentiment = random.choice(['positive', 'negative', 'neutral'])
-    
-    # Select base phrase + corresponding emoji pool
-    if sentiment == 'positive':
-        base = random.choice(positive_phrases)
-        emoji_set = emojis_positive
-    elif sentiment == 'negative':
-        base = random.choice(negative_phrases)
-        emoji_set = emojis_negative
-    else:
-        base = random.choice(neutral_phrases)
-        emoji_set = emojis_neutral
-    
-    # Start building the comment
-    comment_parts = [base]
-    
-    # Randomly add a contraction (50% chance)
-    if random.random() > 0.5:
-        comment_parts.append(random.choice(contractions))
-    
-    # Randomly add additional phrase (60% chance)
-    if random.random() > 0.4:
-        comment_parts.append(random.choice(additional_phrases))
-    
-    # Add emojis (1-3)
-    num_emojis = random.randint(1, 3)
-    emojis = ''.join(random.choices(emoji_set, k=num_emojis))
-    
-    # Randomly insert an HTML tag (40% chance)
-    html = ""
-    if random.random() > 0.6:
-        html = random.choice(html_tags)
-    
-    # Randomly add special characters (50% chance)
-    special = ""
-    if random.random() > 0.5:
-        special = random.choice(special_chars)
-    
-     # Construct final comment string
-    comment = ' '.join(comment_parts) + ' ' + emojis + ' ' + html + special
-    comment = comment.strip()
-    
-    # Ensure comment is unique before adding
-    if comment not in used_combinations:
-        used_combinations.add(comment)
-        comments.append(comment)
+
+for shape, count in shape_counts.items():
+    _, has_contraction, has_phrase, num_emojis, has_html, has_special = shape
+    pools = shape_pools(shape)
+
+    # Pick distinct combinations of this shape by index
+    for index in random.sample(range(shape_space(shape)), count):
+
+        # Decode the index into one item per pool (mixed-radix digits)
+        picks = []
+        for pool in pools:
+            index, digit = divmod(index, len(pool))
+            picks.append(pool[digit])
+        picks = iter(picks)
+
+        # Start building the comment
+        comment_parts = [next(picks)]
+        if has_contraction:
+            comment_parts.append(next(picks))
+        if has_phrase:
+            comment_parts.append(next(picks))
+        emojis = ''.join(next(picks) for _ in range(num_emojis))
+        html = next(picks) if has_html else ""
+        special = next(picks) if has_special else ""
+
+        # Construct final comment string
+        comment = ' '.join(comment_parts) + ' ' + emojis + ' ' + html + special
+        comments.append(comment.strip())
+
+# Comments were built shape by shape; mix them back up
+random.shuffle(comments)
 
 
 # Create DataFrame and save to CSV
 
 df = pd.DataFrame({'Comment': comments})
 
-# Save to CSV
-df.to_csv('data/sample_comments.csv', index=False)
+# Save to CSV (pyarrow's writer serializes in C, multithreaded)
+pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), 'data/sample_comments.csv')
 
 # Final console output for verification
 
@@ -15,8 +15,13 @@ This dataset is used to test the performance and accuracy of the
 Customer Input Data Cleaning Pipeline.
 """
 
+import itertools
+import math
+from collections import Counter
+import numpy as np
 import pandas as pd
-import random
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 # FUNCTION: generate_large_dataset()
 def generate_large_dataset(num_comments=1500):  
@@ -27,7 +32,10 @@ def generate_large_dataset(num_comments=1500):
     num_comments (int): Number of unique comments to generate (default: 1500)
     
     Returns:
-    pd.DataFrame: DataFrame with generated comments
+    pd.DataFrame: DataFrame with exactly num_comments unique comments
+
+    Raises:
+    ValueError: if the phrase lists cannot form num_comments distinct comments
     """
 
     # Predefined phrase lists to build realistic text samples
@@ -98,73 +106,112 @@ def generate_large_dataset(num_comments=1500):
         "amazing packaging", "horrible packaging", "nice presentation", "poor presentation"
     ]
     
-    # Internal variables to track generated data
+    # Each comment has a "shape" (sentiment + which optional parts it has)
+    # and a choice of item for each part. All random draws are made up front
+    # as NumPy arrays: first the shape of every comment, then, per shape,
+    # distinct combinations sampled without replacement from the shape's
+    # index space. Comments are unique by construction; the loop below only
+    # joins strings.
+    rng = np.random.default_rng()
+
+    # Base phrases and emoji set for each sentiment (index = sentiment code)
+    sentiment_pools = [
+        (positive_phrases, emojis_positive),
+        (negative_phrases, emojis_negative),
+        (neutral_phrases, emojis_neutral),
+    ]
+
+    def shape_pools(shape):
+        """Pools a comment of this shape picks from, in the order they appear."""
+        sentiment, has_contraction, has_phrase, num_emojis, has_html, has_special = shape
+        base_pool, emoji_set = sentiment_pools[sentiment]
+
+        pools = [base_pool]
+        if has_contraction:
+            pools.append(contractions)
+        if has_phrase:
+            pools.append(additional_phrases)
+        pools += [emoji_set] * num_emojis
+        if has_html:
+            pools.append(html_tags)
+        if has_special:
+            pools.append(special_chars)
+        return pools
+
+    def shape_space(shape):
+        """Number of distinct comments a shape can produce."""
+        return math.prod(len(pool) for pool in shape_pools(shape))
+
+    def draw_shapes(n):
+        """Draw the shapes of n comments, one column per part."""
+        return np.column_stack([
+            rng.integers(0, 3, n),     # sentiment
+            rng.random(n) > 0.5,       # contraction (50% chance)
+            rng.random(n) > 0.4,       # extra descriptive phrase (60% chance)
+            rng.integers(1, 4, n),     # number of emojis (1-3)
+            rng.random(n) > 0.6,       # HTML insert (40% chance)
+            rng.random(n) > 0.5,       # special characters (50% chance)
+        ])
+
+    # Fail early if there are not enough distinct comments to draw from
+    all_shapes = itertools.product(range(3), (0, 1), (0, 1), (1, 2, 3), (0, 1), (0, 1))
+    if num_comments > sum(shape_space(shape) for shape in all_shapes):
+        raise ValueError(f"Cannot generate {num_comments} unique comments from the available phrases")
+
     comments = []  # List of final comments
-    used_combinations = set() # Ensure uniqueness
-    
     counter = 0 # Count of successfully generated comments
-    max_attempts = num_comments * 10 # Safety limit to avoid infinite loops
-    attempts = 0
-    
+
     print(f"Generating {num_comments} unique comments...")
-    
-     # Main Comment Generation Loop
-    while counter < num_comments and attempts < max_attempts:
-        attempts += 1
-        
-        # Pick sentiment type for this comment
-        sentiment = random.choice(['positive', 'negative', 'neutral'])
-        
-        # Choose base phrase + matching emoji set
-        if sentiment == 'positive':
-            base = random.choice(positive_phrases)
-            emoji_set = emojis_positive
-        elif sentiment == 'negative':
-            base = random.choice(negative_phrases)
-            emoji_set = emojis_negative
-        else:
-            base = random.choice(neutral_phrases)
-            emoji_set = emojis_neutral
-        
-        # Build comment with various elements
-        comment_parts = [base]
-        
-         # Randomly add contraction (50% chance)
-        if random.random() > 0.5:
-            comment_parts.append(random.choice(contractions))
-        
-        # Randomly add an extra descriptive phrase (60% chance)
-        if random.random() > 0.4:
-            comment_parts.append(random.choice(additional_phrases))
-        
-        # Add emojis (1-3)
-        num_emojis = random.randint(1, 3)
-        emojis = ''.join(random.choices(emoji_set, k=num_emojis))
-        
-        # Random HTML insert (40% chance)
-        html = ""
-        if random.random() > 0.6:
-            html = random.choice(html_tags)
-        
-        # Random special characters (50% chance)
-        special = ""
-        if random.random() > 0.5:
-            special = random.choice(special_chars)
-        
-        # Build the final comment text
-        comment = ' '.join(comment_parts) + ' ' + emojis + ' ' + html + special
-        comment = comment.strip()
-        
-        # Add only unique comments
-        if comment not in used_combinations:
-            used_combinations.add(comment)
-            comments.append(comment)
+
+    # Count how many comments each shape gets. A shape cannot hold more
+    # comments than its combinations; rows beyond that are redrawn with a
+    # new shape until every row has a place.
+    shape_counts = Counter()
+    shortfall = num_comments
+    while shortfall:
+        unique_shapes, counts = np.unique(draw_shapes(shortfall), axis=0, return_counts=True)
+        for shape, count in zip(map(tuple, unique_shapes.tolist()), counts.tolist()):
+            shape_counts[shape] = min(shape_counts[shape] + count, shape_space(shape))
+        shortfall = num_comments - sum(shape_counts.values())
+
+    # Main Comment Generation Loop
+    for shape, count in shape_counts.items():
+        _, has_contraction, has_phrase, num_emojis, has_html, has_special = shape
+        pools = shape_pools(shape)
+
+        # Pick distinct combinations of this shape by index, then decode all
+        # indices at once into one item column per pool
+        dims = [len(pool) for pool in pools]
+        space = math.prod(dims)
+        indices = rng.choice(space, size=count, replace=False)
+        digits = np.unravel_index(indices, dims)
+        columns = [np.array(pool, dtype=object)[d] for pool, d in zip(pools, digits)]
+
+        for picks in zip(*columns):
+            picks = iter(picks)
+
+            # Build comment with various elements
+            comment_parts = [next(picks)]
+            if has_contraction:
+                comment_parts.append(next(picks))
+            if has_phrase:
+                comment_parts.append(next(picks))
+            emojis = ''.join(next(picks) for _ in range(num_emojis))
+            html = next(picks) if has_html else ""
+            special = next(picks) if has_special else ""
+
+            # Build the final comment text
+            comment = ' '.join(comment_parts) + ' ' + emojis + ' ' + html + special
+            comments.append(comment.strip())
             counter += 1
-            
-             # Print progress for every 150 comments generated
+
+            # Print progress for every 150 comments generated
             if counter % 150 == 0:
                 print(f"  Generated {counter} comments...")
 
+    # Comments were built shape by shape; mix them back up
+    rng.shuffle(comments)
+
     # Convert list to DataFrame and return
     df = pd.DataFrame({'Comment': comments})
     return df
@@ -178,8 +225,8 @@ if __name__ == "__main__":
     # Generate 1500 unique comments (1000+)
     df = generate_large_dataset(1500)
     
-    # Save to CSV
-    df.to_csv('data/sample_comments.csv', index=False)
+    # Save to CSV (pyarrow's writer serializes in C, multithreaded)
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), 'data/sample_comments.csv')
     
     #Summary output
     print(f"\n Successfully generated {len(df)} unique comments")
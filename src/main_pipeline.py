@@ -4,48 +4,84 @@ main_pipeline.py
 This script runs the complete Customer Input Data Cleaning Pipeline.
 It performs the following steps:
 
-1. Load raw dataset from CSV (sample_comments.csv)
+1. Load raw dataset from CSV (sample_comments.csv) in chunks
 2. Clean all comments using the vectorized cleaning pipeline
 3. Generate metadata (word counts, cleaning success flag)
-4. Save cleaned results to cleaned_output.csv
-5. Produce a summary report
+4. Append each cleaned chunk to cleaned_output.csv
+5. Produce a summary report from running totals
 6. Display before–after examples
 
+The input is parsed by Arrow's multithreaded CSV reader and only one chunk
+is held in memory at a time, so peak memory is bounded by CHUNK_BYTES
+rather than by the size of the input file.
+
 This file acts as the main controller of the cleaning process.
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Import cleaning functions from cleaning_functions.py
-from cleaning_functions import clean_comment, flag_cleaning_success, count_words
+from cleaning_functions import clean_series_parallel, count_words
 
 # Configuration Variables
 INPUT_FILE = 'data/sample_comments.csv'  # Raw input file
 OUTPUT_FILE = 'data/cleaned_output.csv' # Output cleaned file
+CHUNK_BYTES = 8 * 1024 * 1024  # CSV bytes read, cleaned and written per batch
 
 # FUNCTION 1: Load Data
-def load_data(file_path):
+def load_data(file_path, chunk_bytes=CHUNK_BYTES):
     """
-    Load CSV file into a pandas DataFrame.
+    Open a CSV file for reading in chunks of pandas DataFrames.
+
+    pd.read_csv(engine='pyarrow') cannot read in chunks, so Arrow's
+    streaming reader is used directly; each batch becomes a DataFrame
+    with an Arrow-backed "string[pyarrow]" 'Comment' column.
     
     Parameters:
     file_path (str): Path to the CSV file
+    chunk_bytes (int): Approximate size of each chunk in bytes of CSV text
     
     Returns:
-    pd.DataFrame: DataFrame with comments
+    Iterator[pd.DataFrame]: Chunks holding only the 'Comment' column
 
     Raises:
-    Exits program if file is not found or unreadable.
+    Exits program if file is not found or unreadable, including when a
+    later chunk fails to parse while it is being read.
     """
+    string_dtype = pd.StringDtype("pyarrow")
+
+    def read_chunks(reader):
+        # Chunks are parsed lazily, so parse errors surface here while
+        # iterating, not when the file is opened
+        try:
+            for batch in reader:
+                yield batch.to_pandas(types_mapper=lambda _: string_dtype)
+        except Exception as e:
+            print(f"\n Error loading data: {str(e)}")
+            sys.exit(1)
+
     try:
-        df = pd.read_csv(file_path)
-        print(f" Data loaded successfully from {file_path}")
-        print(f" Total rows: {len(df)}")
-        return df
+        # The streaming reader infers types from the first block only, so the
+        # column is pinned to string: numeric-looking or all-empty first
+        # blocks would otherwise type it as int64/null. As a string column,
+        # empty cells are read as empty strings, not nulls.
+        reader = pacsv.open_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(block_size=chunk_bytes),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=['Comment'], column_types={'Comment': pa.string()}),
+        )
+        print(f" Data opened successfully from {file_path}")
+        print(f" Reading in chunks of {chunk_bytes // (1024 * 1024)} MB")
+        return read_chunks(reader)
     except FileNotFoundError:
         print(f" Error: File '{file_path}' not found!")
         sys.exit(1)
@@ -54,95 +90,144 @@ def load_data(file_path):
         sys.exit(1)
 
 # FUNCTION 2: Process Comments (Vectorized - FAST)
-def process_comments_vectorized(df):
+def process_comments_vectorized(df, executor=None):
     """
     Apply the full cleaning pipeline to all comments using an optimized
-    vectorized approach with pandas .apply().
+    vectorized approach: the whole column is cleaned with clean_series()
+    (Series.str operations, run across a process pool for large inputs)
+    and the metadata is computed with array ops.
 
     Parameters:
         df (pd.DataFrame): DataFrame containing a 'Comment' column.
+        executor (ProcessPoolExecutor, optional): Pool reused across chunks;
+            if omitted, a pool is started only when the input is large.
 
     Returns:
-        (pd.DataFrame, float): 
+        (pd.DataFrame, float, float): 
             - Cleaned DataFrame with metadata
-            - Total processing time in seconds
+            - Total processing time in seconds (wall clock)
+            - CPU time of this process in seconds (excludes pool workers)
     """
-    print("\n" + "="*80)
-    print("PROCESSING COMMENTS (OPTIMIZED VECTORIZED VERSION)...")
-    print("="*80 + "\n")
+    # perf_counter is monotonic and high-resolution (time.time() can jump
+    # with clock adjustments); process_time separates CPU from waiting
+    start_ns = time.perf_counter_ns()
+    start_cpu = time.process_time()
     
-    start_time = time.time()
-    
-    # Apply the cleaning pipeline to each row in the DataFrame
-    results = df['Comment'].apply(lambda x: clean_comment(x))
-    
-    # Extract cleaned text and word statistics
-    df['Cleaned_Comment'] = results.apply(lambda x: x[0])
-    df['Words_Before'] = results.apply(lambda x: x[1])
-    df['Words_After'] = results.apply(lambda x: x[2])
-    df['Words_Removed'] = df['Words_Before'] - df['Words_After']
+    comments = df['Comment']
 
-    # Flag success or failure
-    df['Cleaning_Success'] = df.apply(
-        lambda row: flag_cleaning_success(row['Comment'], row['Cleaned_Comment']), 
-        axis=1
-    )
+    # Clean the whole column at once (spread over CPU cores for large inputs)
+    cleaned = clean_series_parallel(comments, executor=executor)
     
-    # Rename 'Comment' to 'Original_Comment' for clarity
-    df = df.rename(columns={'Comment': 'Original_Comment'})
+    # Word statistics straight from the columns (no per-row apply)
+    words_before = comments.str.split().str.len().to_numpy()
+    words_after = cleaned.str.split().str.len().to_numpy()
     
-    # Reorder columns for better readability
-    df = df[['Original_Comment', 'Cleaned_Comment', 'Words_Before', 
-             'Words_After', 'Words_Removed', 'Cleaning_Success']]
+    # Build the output frame directly in its final column order (no
+    # rename + reorder copies). Counts are stored in the smallest integer
+    # type that fits (usually uint8/int8 instead of int64). Words_Removed
+    # can be negative: an expanded contraction such as "didn't" -> "did not"
+    # adds a word. The success flag follows flag_cleaning_success() (anything
+    # left after cleaning counts as success) and is a categorical built
+    # straight from 0/1 codes, so no strings per row.
+    df = pd.DataFrame({
+        'Original_Comment': comments,
+        'Cleaned_Comment': cleaned,
+        'Words_Before': pd.to_numeric(words_before, downcast='unsigned'),
+        'Words_After': pd.to_numeric(words_after, downcast='unsigned'),
+        'Words_Removed': pd.to_numeric(words_before - words_after, downcast='integer'),
+        'Cleaning_Success': pd.Categorical.from_codes(
+            (words_after > 0).astype(np.int8), categories=['Failed', 'Success']),
+    }, index=df.index, copy=False)
     
-    end_time = time.time()
-    processing_time = end_time - start_time
+    processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+    cpu_time = time.process_time() - start_cpu
     
-    print(f" All {len(df)} comments processed successfully!")
-    print(f" Processing time: {processing_time:.2f} seconds")
+    # Printed after the timers are read, so console output is not timed
+    print(f" {len(df)} comments processed in {processing_time:.2f} seconds")
     
-    return df, processing_time
+    return df, processing_time, cpu_time
 
 # FUNCTION 3: Save Cleaned Data
-def save_cleaned_data(df, output_file):
+def save_cleaned_data(df, output_file, append=False):
     """
     Save cleaned results to a CSV file.
 
+    Rows are serialized by Arrow's multithreaded CSV writer (C++) rather
+    than pandas' row-by-row to_csv().
+
     Parameters:
         df (pd.DataFrame): Cleaned DataFrame
         output_file (str): Output path for cleaned CSV
+        append (bool): Append to an existing file (no header) instead of
+            overwriting it; used for every chunk after the first
     """
     try:
-        df.to_csv(output_file, index=False)
-        print(f"\n Cleaned data saved to {output_file}")
-        print(f"  Total rows saved: {len(df)}")
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        # Large record batches and an 8 MB file buffer keep the number of
+        # write calls small
+        options = pacsv.WriteOptions(include_header=not append, batch_size=65536)
+        with open(output_file, 'ab' if append else 'wb', buffering=8 * 1024 * 1024) as f:
+            pacsv.write_csv(table, f, write_options=options)
+        print(f" Saved {len(df)} rows to {output_file}")
     except Exception as e:
         print(f"\n Error saving data: {str(e)}")
         sys.exit(1)
 
-# FUNCTION 4: Generate Summary Report
-def generate_summary_report(df, processing_time):
+# FUNCTION 4: Accumulate Summary Statistics
+def update_summary_stats(stats, df):
+    """
+    Add one cleaned chunk to the running totals used by the summary
+    report, so the full cleaned dataset never has to stay in memory.
+
+    Parameters:
+        stats (dict or None): Totals so far (None before the first chunk)
+        df (pd.DataFrame): Cleaned chunk with metadata
+
+    Returns:
+        dict: Updated totals
+    """
+    if stats is None:
+        stats = {'total_comments': 0, 'successful': 0, 'failed': 0,
+                 'words_before': 0, 'words_after': 0, 'words_removed': 0}
+
+    stats['total_comments'] += len(df)
+    # One pass over the flag column for both counts
+    counts = df['Cleaning_Success'].value_counts()
+    stats['successful'] += int(counts.get('Success', 0))
+    stats['failed'] += int(counts.get('Failed', 0))
+
+    # All three word totals from one reduction call; the averages in the
+    # report are derived from these sums
+    sums = df[['Words_Before', 'Words_After', 'Words_Removed']].sum()
+    stats['words_before'] += int(sums['Words_Before'])
+    stats['words_after'] += int(sums['Words_After'])
+    stats['words_removed'] += int(sums['Words_Removed'])
+    return stats
+
+# FUNCTION 5: Generate Summary Report
+def generate_summary_report(stats, processing_time, cpu_time):
     """
     Generate a summary report of pipeline performance and cleaning results.
 
     Parameters:
-        df (pd.DataFrame): Cleaned data with metadata
+        stats (dict): Running totals from update_summary_stats()
         processing_time (float): Total processing time in seconds
+        cpu_time (float): CPU time of the main process in seconds
     """
     print("\n" + "="*80)
     print("SUMMARY REPORT")
     print("="*80)
     
     #basic statistics
-    total_comments = len(df)
-    successful = len(df[df['Cleaning_Success'] == 'Success'])
-    failed = len(df[df['Cleaning_Success'] == 'Failed'])
+    total_comments = stats['total_comments']
+    successful = stats['successful']
+    failed = stats['failed']
     
-    avg_words_before = df['Words_Before'].mean()
-    avg_words_after = df['Words_After'].mean()
-    avg_words_removed = df['Words_Removed'].mean()
+    avg_words_before = stats['words_before'] / total_comments
+    avg_words_after = stats['words_after'] / total_comments
+    avg_words_removed = stats['words_removed'] / total_comments
     
-    total_words_removed = df['Words_Removed'].sum()
+    total_words_removed = stats['words_removed']
     
     # Display summary
     print(f"\nTotal Comments Processed: {total_comments}")
@@ -157,6 +242,7 @@ def generate_summary_report(df, processing_time):
     
     print(f"\nPerformance Metrics:")
     print(f"  Total Time: {processing_time:.2f} seconds")
+    print(f"  CPU Time (main process): {cpu_time:.2f} seconds")
     print(f"  Time per Comment: {processing_time/total_comments*1000:.2f} ms")
     print(f"  Comments per Second: {total_comments/processing_time:.2f}")
     
@@ -170,7 +256,7 @@ def generate_summary_report(df, processing_time):
     
     print("\n" + "="*80)
 
-# FUNCTION 5: Display Sample Results
+# FUNCTION 6: Display Sample Results
 def display_sample_results(df, num_samples=5):
     """
    Print sample before - after cleaning examples to the console.
@@ -183,12 +269,13 @@ def display_sample_results(df, num_samples=5):
     print(f"SAMPLE BEFORE-AFTER EXAMPLES (First {num_samples}):")
     print("="*80)
     
-    for idx in range(min(num_samples, len(df))):
-        row = df.iloc[idx]
+    # Plain tuples for just the first rows (no Series built per row)
+    samples = df.head(num_samples).itertuples(index=False, name=None)
+    for idx, (original, cleaned, words_before, words_after, _, status) in enumerate(samples):
         print(f"\nExample {idx + 1}:")
-        print(f"  BEFORE: {row['Original_Comment'][:80]}")
-        print(f"  AFTER:  {row['Cleaned_Comment'][:80]}")
-        print(f"  Words: {row['Words_Before']} → {row['Words_After']} | Status: {row['Cleaning_Success']}")
+        print(f"  BEFORE: {original[:80]}")
+        print(f"  AFTER:  {cleaned[:80]}")
+        print(f"  Words: {words_before} → {words_after} | Status: {status}")
     
     print("\n" + "="*80)
 
@@ -201,25 +288,52 @@ def main():
     print("CUSTOMER INPUT DATA CLEANING PIPELINE (OPTIMIZED)")
     print("="*80)
     
-    # Step 1: Load raw CSV
+    # Step 1: Open raw CSV (read lazily, one chunk at a time)
     print("\nSTEP 1: Loading Data...")
-    df_input = load_data(INPUT_FILE)
+    chunks = load_data(INPUT_FILE)
     
-    # Step 2: Clean all comments
+    # Steps 2-3: Clean each chunk and append it to the output file,
+    # keeping only running totals and the first rows for the samples
     print("\nSTEP 2: Processing Comments...")
-    df_cleaned, processing_time = process_comments_vectorized(df_input)
+    print("\n" + "="*80)
+    print("PROCESSING COMMENTS (OPTIMIZED VECTORIZED VERSION)...")
+    print("="*80 + "\n")
     
-    # Step 3: Save cleaned data
-    print("\nSTEP 3: Saving Cleaned Data...")
-    save_cleaned_data(df_cleaned, OUTPUT_FILE)
+    stats = None
+    samples = None
+    processing_time = 0.0
+    cpu_time = 0.0
+    # One worker pool for the whole stream; worker processes are only
+    # started if a chunk is large enough to be cleaned in parallel
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for chunk in chunks:
+                df_cleaned, chunk_time, chunk_cpu = process_comments_vectorized(chunk, executor=pool)
+                processing_time += chunk_time
+                cpu_time += chunk_cpu
+                
+                # Step 3: Save cleaned data (first chunk overwrites, the rest append)
+                save_cleaned_data(df_cleaned, OUTPUT_FILE, append=stats is not None)
+                
+                stats = update_summary_stats(stats, df_cleaned)
+                if samples is None:
+                    samples = df_cleaned.head(5)
+    except SystemExit:
+        # A chunk failed to load or save: don't leave a partial output file
+        Path(OUTPUT_FILE).unlink(missing_ok=True)
+        raise
+    
+    if stats is None:
+        print(f" Error: No comments found in '{INPUT_FILE}'!")
+        sys.exit(1)
     
     # Step 4: Generate summary report
     print("\nSTEP 4: Generating Summary Report...")
-    generate_summary_report(df_cleaned, processing_time)
+    generate_summary_report(stats, processing_time, cpu_time)
     
     # Step 5: Display sample results
     print("\nSTEP 5: Displaying Sample Results...")
-    display_sample_results(df_cleaned, num_samples=5)
+    display_sample_results(samples, num_samples=5)
     
     print("\n✓ Pipeline execution completed successfully!")
     print(f"✓ Output file: {OUTPUT_FILE}")